@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from ..utils.api import APIUtils
 from ..utils.data import DataManager
 from ..utils.github import GitCloneManager
@@ -27,8 +28,8 @@ class GitHubProfileAnalyzer:
         # Local data additional filters
         self.data_filter = GitHubDataFilter(self.github_fetch)
 
-        # Github event watcher application
-        self.monitor = GitHubMonitor(self.api_utils)
+        # Github event watcher application, created on first use (see monitor)
+        self._monitor = None
 
         # Local data object initialization
         self.data = self.data_manager.load_existing() or {}
@@ -38,6 +39,16 @@ class GitHubProfileAnalyzer:
             f"{'Found' if self.data else 'No'} data in {self.data_manager.report_file}"
         )
 
+    @property
+    def monitor(self):
+        """
+        Event watcher, built lazily: its setup reconfigures the monitoring log,
+        which only recent events need and which would be repeated per target.
+        """
+        if self._monitor is None:
+            self._monitor = GitHubMonitor(self.api_utils, self.github_fetch)
+        return self._monitor
+
     def run_analysis(self):
         """Build required for generate_report() profile's data object"""
         try:
@@ -175,61 +186,78 @@ class GitHubProfileAnalyzer:
             return
 
         try:
-            # Find mutual followers
-            mutual_followers = set(
-                f["login"] for f in self.data.get("followers", [])
-            ) & set(f["login"] for f in self.data.get("following", []))
+            # Find mutual followers, kept in followers order for stable reports
+            following_logins = set(f["login"] for f in self.data.get("following", []))
+            mutual_followers = list(
+                dict.fromkeys(
+                    f["login"]
+                    for f in self.data.get("followers", [])
+                    if f["login"] in following_logins
+                )
+            )
 
-            # Find contributors to owner's repos
-            contributors = []
+            # Classify repos as forked or original in a single pass
+            repo_list = []
+            forked_repo_list = []
             for repo in self.data["repos"]:
-                if not repo["fork"]:
-                    repo_name = repo["name"]
-                    repo_contributors = self.github_fetch.fetch_repository_contributors(
+                if repo["fork"]:
+                    forked_repo_list.append(repo["name"])
+                else:
+                    repo_list.append(repo["name"])
+
+            # Find contributors to owner's repos, one request per repo run concurrently
+            with ThreadPoolExecutor(max_workers=self.api_utils.MAX_WORKERS) as executor:
+                repos_contributors = executor.map(
+                    lambda repo_name: self.github_fetch.fetch_repository_contributors(
                         self.username, repo_name
+                    ),
+                    repo_list,
+                )
+
+            contributors = []
+            for repo_name, repo_contributors in zip(repo_list, repos_contributors):
+                if repo_contributors:
+                    contributors.append(
+                        {
+                            "repo": repo_name,
+                            "contributors": [
+                                contributor["login"]
+                                for contributor in repo_contributors
+                            ],
+                        }
                     )
-                    if repo_contributors:
-                        contributors.append(
-                            {
-                                "repo": repo_name,
-                                "contributors": [
-                                    contributor["login"]
-                                    for contributor in repo_contributors
-                                ],
-                            }
-                        )
-
-            # Classify repos as forked or original
-            repo_list = [
-                repo["name"] for repo in self.data["repos"] if not repo["fork"]
-            ]
-            forked_repo_list = [
-                repo["name"] for repo in self.data["repos"] if repo["fork"]
-            ]
+
+            # Collapse commits into distinct (author, committer) identities first,
+            # most commits repeat the same few names and emails
+            identities = dict.fromkeys(
+                (
+                    commit["commit"]["author"]["name"],
+                    commit["commit"]["author"]["email"],
+                    commit["commit"]["committer"]["name"],
+                    commit["commit"]["committer"]["email"],
+                )
+                for commits in self.data["commits"].values()
+                for commit in commits
+            )
 
             # Find unique emails in commit messages and connect with commits
             unique_emails = {}
-            for repo_name, commits in self.data["commits"].items():
-                for commit in commits:
-                    author_email = commit["commit"]["author"]["email"]
-                    author_name = commit["commit"]["author"]["name"]
-                    committer_email = commit["commit"]["committer"]["email"]
-                    committer_name = commit["commit"]["committer"]["name"]
-
-                    if author_email not in unique_emails:
-                        unique_emails[author_email] = author_name
-                    if committer_email not in unique_emails:
-                        unique_emails[committer_email] = committer_name
+            for author_name, author_email, committer_name, committer_email in identities:
+                if author_email not in unique_emails:
+                    unique_emails[author_email] = author_name
+                if committer_email not in unique_emails:
+                    unique_emails[committer_email] = committer_name
 
             unique_emails_list = [
                 {"email": email, "name": name} for email, name in unique_emails.items()
             ]
 
             # Calculate the total count of original and forked repos
-            original_repos_count = sum(
-                1 for repo in self.data["repos"] if not repo["fork"]
-            )
-            forked_repos_count = sum(1 for repo in self.data["repos"] if repo["fork"])
+            original_repos_count = len(repo_list)
+            forked_repos_count = len(forked_repo_list)
+
+            # GitHub logins are case-insensitive, normalize the owner once
+            username_lower = self.username.lower()
 
             # Check if user has contributed to other repositories via PRs
             pull_requests_to_other_repos = {}
@@ -239,7 +267,7 @@ class GitHubProfileAnalyzer:
                 for item in search_results:
                     repo_name = item["repository_url"].split("/")[-1]
                     owner_name = item["repository_url"].split("/")[-2]
-                    if owner_name != self.username:
+                    if owner_name.lower() != username_lower:
                         pr_url = item["html_url"]
                         repo_key = f"{owner_name}/{repo_name}"
                         if repo_key not in pull_requests_to_other_repos:
@@ -254,7 +282,7 @@ class GitHubProfileAnalyzer:
                 for item in search_commits_results:
                     repo_name = item["repository"]["html_url"].split("/")[-1]
                     owner_name = item["repository"]["owner"]["login"]
-                    if owner_name != self.username:
+                    if owner_name.lower() != username_lower:
                         commit_sha = item["sha"]
                         repo_key = f"{owner_name}/{repo_name}"
                         if repo_key not in commits_to_other_repos:
@@ -310,7 +338,7 @@ class GitHubProfileAnalyzer:
                 "profile_info": profile_info,
                 "original_repos_count": original_repos_count,
                 "forked_repos_count": forked_repos_count,
-                "mutual_followers": list(mutual_followers),
+                "mutual_followers": mutual_followers,
                 "following": following_list,
                 "followers": followers_list,
                 "repo_list": repo_list,
@@ -1,10 +1,42 @@
+import json
 import logging
 import os
+import shutil
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Tuple, Optional
 from ..utils.api import APIUtils
 from ..utils.config import MAX_FOLLOWING, MAX_FOLLOWERS, MAX_REPOSITORIES
 
+# GraphQL search returning issues, optionally with their first page of comments
+ISSUES_SEARCH_QUERY = """
+query($q: String!, $first: Int!, $cursor: String) {
+  search(query: $q, type: ISSUE, first: $first, after: $cursor) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on Issue {
+        number
+        title
+        body
+        state
+        createdAt
+        url
+        repository { nameWithOwner }
+        %s
+      }
+    }
+  }
+}
+"""
+
+ISSUE_COMMENTS_FIELDS = """
+        comments(first: 100) {
+          totalCount
+          nodes { databaseId url body createdAt updatedAt author { login } }
+        }
+"""
+
 class GithubFetchManager:
     def __init__(self, api_utils: APIUtils):
         self.api_utils = api_utils
@@ -12,48 +44,69 @@ class GithubFetchManager:
     def fetch_profile_data(self, username: str) -> Dict:
         """Fetch basic profile information for a user."""
         url = f"{self.api_utils.GITHUB_API_URL}/users/{username}"
-        data, _ = self.api_utils.github_api_request(url)
+        data, _ = self.api_utils.github_api_request(url, cache=True)
         return data
         
     def fetch_following(self, username: str, limit: Optional[int] = None) -> List[Dict]:
-        """Fetch list of users that the given user follows."""
+        """Fetch list of users that the given user follows, up to limit (MAX_FOLLOWING)."""
         url = f"{self.api_utils.GITHUB_API_URL}/users/{username}/following"
         return self.api_utils.fetch_all_pages(
             url, 
             {"per_page": self.api_utils.ITEMS_PER_PAGE}, 
-            limit=MAX_FOLLOWING
+            limit=limit if limit is not None else MAX_FOLLOWING,
+            cache=True,
         )
         
     def fetch_followers(self, username: str, limit: Optional[int] = None) -> List[Dict]:
-        """Fetch list of users following the given user."""
+        """Fetch list of users following the given user, up to limit (MAX_FOLLOWERS)."""
         url = f"{self.api_utils.GITHUB_API_URL}/users/{username}/followers"
         return self.api_utils.fetch_all_pages(
             url, 
             {"per_page": self.api_utils.ITEMS_PER_PAGE}, 
-            limit=MAX_FOLLOWERS
+            limit=limit if limit is not None else MAX_FOLLOWERS,
+            cache=True,
         )
         
     def fetch_repositories(self, username: str, limit: Optional[int] = None) -> List[Dict]:
-        """Fetch repositories for a user."""
+        """Fetch repositories for a user, up to limit (MAX_REPOSITORIES)."""
         url = f"{self.api_utils.GITHUB_API_URL}/users/{username}/repos"
         return self.api_utils.fetch_all_pages(
             url, 
             {"per_page": self.api_utils.ITEMS_PER_PAGE}, 
-            limit=MAX_REPOSITORIES
+            limit=limit if limit is not None else MAX_REPOSITORIES,
+            cache=True,
         )
         
     def fetch_repository_contributors(self, username: str, repo_name: str) -> List[Dict]:
         """Fetch contributors for a specific repository."""
         url = f"{self.api_utils.GITHUB_API_URL}/repos/{username}/{repo_name}/contributors"
-        return self.api_utils.fetch_all_pages(url)
+        return self.api_utils.fetch_all_pages(url, cache=True)
         
-    def fetch_user_events(self, username: str, etag: Optional[str] = None) -> Tuple[List[Dict], Optional[str], int]:
-        """Fetch events for a user with optional ETag for caching."""
+    def fetch_user_events(self, username: str, etag: Optional[str] = None) -> Tuple[List[Dict], Optional[str], Optional[int]]:
+        """
+        Fetch events for a user with optional ETag for caching.
+        The returned poll interval is None when the request failed.
+        """
         url = f"{self.api_utils.GITHUB_API_URL}/users/{username}/events"
         events, headers = self.api_utils.github_api_request(url, etag=etag)
-        new_etag = headers.get("ETag") if headers else None
-        poll_interval = int(headers.get("X-Poll-Interval", 60)) if headers else 60
-        return events, new_etag, poll_interval
+        if not headers:
+            return [], etag, None
+
+        # A 304 or an answer without ETag keeps the previous one, the conditional
+        # request chain would otherwise restart with a full response
+        new_etag = headers.get("ETag")
+        if events and not new_etag:
+            logging.debug(f"Events of {username} returned without an ETag")
+        poll_interval = int(headers.get("X-Poll-Interval", 60))
+
+        # Close to the rate limit, don't poll again before the window resets
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is not None and reset is not None:
+            if int(remaining) < self.api_utils.RATE_LIMIT_RESERVE:
+                poll_interval = max(poll_interval, int(reset) - int(time.time()))
+
+        return events or [], new_etag or etag, poll_interval
         
     def search_pull_requests(self, username: str) -> List[Dict]:
         """Search for pull requests by a user."""
@@ -62,7 +115,7 @@ class GithubFetchManager:
             "q": f"type:pr author:{username}",
             "per_page": self.api_utils.ITEMS_PER_PAGE,
         }
-        return self.api_utils.fetch_all_pages(search_url, search_params)
+        return self.api_utils.fetch_all_pages(search_url, search_params, cache=True)
         
     def search_commits(self, username: str = None, message: str = None) -> List[Dict]:
         """Search for commits by a user or by commit message."""
@@ -80,7 +133,7 @@ class GithubFetchManager:
             "per_page": self.api_utils.ITEMS_PER_PAGE,
         }
         
-        return self.api_utils.fetch_all_pages(search_url, search_params)
+        return self.api_utils.fetch_all_pages(search_url, search_params, cache=True)
 
     def fetch_user_issues(self, username: str) -> List[Dict]:
         """
@@ -98,20 +151,33 @@ class GithubFetchManager:
             "per_page": self.api_utils.ITEMS_PER_PAGE,
         }
 
-        raw_issues = self.api_utils.fetch_all_pages(search_url, search_params)
+        graphql_issues = self._graphql_search_issues(search_params["q"])
+        if graphql_issues is not None:
+            return [
+                {
+                    "repo": issue["repository"]["nameWithOwner"],
+                    "created_at": issue["createdAt"],
+                    "title": issue["title"],
+                    "url": self.api_utils.github_path(issue["url"]),
+                    "body": issue["body"],
+                    "state": issue["state"].lower(),
+                    "number": issue["number"],
+                }
+                for issue in graphql_issues
+            ]
 
-        # Process and clean up the issue data
+        # Process and clean up the issue data page by page
         cleaned_issues = []
-        for issue in raw_issues:
+        for issue in self.api_utils.iter_pages(search_url, search_params, cache=True):
             # Extract repo name from repository_url (format: ".../repos/owner/repo")
-            repo_parts = issue["repository_url"].split("/")
-            repo_name = f"{repo_parts[-2]}/{repo_parts[-1]}"
+            _, repo_owner, repo_name = issue["repository_url"].rsplit("/", 2)
+            repo_name = f"{repo_owner}/{repo_name}"
 
             cleaned_issues.append({
                 "repo": repo_name,
                 "created_at": issue["created_at"],
                 "title": issue["title"],
-                "url": issue["html_url"].replace("https://github.com", ""),
+                "url": self.api_utils.github_path(issue["html_url"]),
                 "body": issue["body"],
                 "state": issue["state"],
                 "number": issue["number"]
@@ -119,14 +185,42 @@ class GithubFetchManager:
 
         return cleaned_issues
     
+    def _graphql_search_issues(self, query: str, with_comments: bool = False) -> Optional[List[Dict]]:
+        """
+        Run an issue search through GraphQL, following all result pages.
+        Returns None when GraphQL is unavailable or any page fails, so callers
+        use REST instead of a truncated result.
+        """
+        graphql_query = ISSUES_SEARCH_QUERY % (ISSUE_COMMENTS_FIELDS if with_comments else "")
+        variables = {"q": query, "first": self.api_utils.ITEMS_PER_PAGE, "cursor": None}
+
+        issues = []
+        while True:
+            data = self.api_utils.github_graphql_request(graphql_query, variables)
+            if data is None:
+                # A partial result would be stored as complete, redo the search over REST
+                if issues:
+                    logging.warning(
+                        "GraphQL search failed after %d issues, falling back to REST",
+                        len(issues),
+                    )
+                return None
+
+            search = data["search"]
+            issues.extend(node for node in search["nodes"] if node)
+            if not search["pageInfo"]["hasNextPage"]:
+                return issues
+            variables["cursor"] = search["pageInfo"]["endCursor"]
+
     def fetch_issue_comments(self, repo_owner: str, repo_name: str, issue_number: int) -> List[Dict]:
         """
-        Fetch comments for a specific issue.
+        Fetch all comments for a specific issue, following every page.
         Handles the direct array response from the API.
         """
         url = f"{self.api_utils.GITHUB_API_URL}/repos/{repo_owner}/{repo_name}/issues/{issue_number}/comments"
-        comments, _ = self.api_utils.github_api_request(url)
-        return comments if comments else []
+        return self.api_utils.fetch_all_pages(
+            url, {"per_page": self.api_utils.ITEMS_PER_PAGE}, cache=True
+        )
 
     def fetch_user_issue_comments(self, username: str) -> List[Dict]:
         """
@@ -144,27 +238,39 @@ class GithubFetchManager:
             "per_page": self.api_utils.ITEMS_PER_PAGE,
         }
         
-        raw_issues = self.api_utils.fetch_all_pages(search_url, search_params)
-        
+        graphql_issues = self._graphql_search_issues(
+            search_params["q"], with_comments=True
+        )
+        if graphql_issues is not None:
+            return self._clean_graphql_issue_comments(username, graphql_issues)
+
+        raw_issues = self.api_utils.fetch_all_pages(search_url, search_params, cache=True)
+
+        def issue_comments(issue):
+            _, repo_owner, repo_name = issue["repository_url"].rsplit("/", 2)
+            return self.fetch_issue_comments(repo_owner, repo_name, issue["number"])
+
+        # Comment requests are independent, overlap their round-trips
+        with ThreadPoolExecutor(max_workers=self.api_utils.MAX_WORKERS) as executor:
+            issues_comments = list(executor.map(issue_comments, raw_issues))
+
+        username_lower = username.lower()
         cleaned_comments = []
-        for issue in raw_issues:
+        for issue, comments in zip(raw_issues, issues_comments):
             # Get repo info
-            repo_parts = issue["repository_url"].split("/")
-            repo_owner = repo_parts[-2]
-            repo_name = repo_parts[-1]
-            
-            # Fetch comments for this specific issue using direct request
-            comments = self.fetch_issue_comments(repo_owner, repo_name, issue["number"])
+            _, repo_owner, repo_name = issue["repository_url"].rsplit("/", 2)
             
             # Filter for comments by our user and clean the data
             for comment in comments:
-                if comment["user"]["login"].lower() == username.lower():
+                # Exact match is the common case, only casefold when it misses
+                login = comment["user"]["login"]
+                if login == username or login.lower() == username_lower:
                     cleaned_comments.append({
                         "repo": f"{repo_owner}/{repo_name}",
                         "issue_title": issue["title"],
                         "issue_number": issue["number"],
-                        "issue_url": issue["html_url"].replace("https://github.com", ""),
-                        "comment_url": comment["html_url"].replace("https://github.com", ""),
+                        "issue_url": self.api_utils.github_path(issue["html_url"]),
+                        "comment_url": self.api_utils.github_path(comment["html_url"]),
                         "comment_id": comment["id"],
                         "created_at": comment["created_at"],
                         "updated_at": comment["updated_at"],
@@ -173,6 +279,60 @@ class GithubFetchManager:
         
         return cleaned_comments
     
+    def _clean_graphql_issue_comments(self, username: str, issues: List[Dict]) -> List[Dict]:
+        """Filter user's comments out of GraphQL issue nodes (with nested comments)."""
+        username_lower = username.lower()
+        cleaned_comments = []
+        for issue in issues:
+            repo_owner, repo_name = issue["repository"]["nameWithOwner"].split("/")
+            comments = issue["comments"]
+
+            # Only the first page of comments is nested, fetch long threads over REST
+            if comments["totalCount"] > len(comments["nodes"]):
+                rest_comments = self.fetch_issue_comments(repo_owner, repo_name, issue["number"])
+                comment_nodes = [
+                    {
+                        "databaseId": comment["id"],
+                        "url": comment["html_url"],
+                        "body": comment["body"],
+                        "createdAt": comment["created_at"],
+                        "updatedAt": comment["updated_at"],
+                        "author": comment["user"],
+                    }
+                    for comment in rest_comments
+                ]
+            else:
+                comment_nodes = comments["nodes"]
+
+            for comment in comment_nodes:
+                # Author is null for deleted accounts
+                if not comment["author"]:
+                    continue
+                login = comment["author"]["login"]
+                if login == username or login.lower() == username_lower:
+                    cleaned_comments.append({
+                        "repo": f"{repo_owner}/{repo_name}",
+                        "issue_title": issue["title"],
+                        "issue_number": issue["number"],
+                        "issue_url": self.api_utils.github_path(issue["url"]),
+                        "comment_url": self.api_utils.github_path(comment["url"]),
+                        "comment_id": comment["databaseId"],
+                        "created_at": comment["createdAt"],
+                        "updated_at": comment["updatedAt"],
+                        "body": comment["body"],
+                    })
+
+        return cleaned_comments
+
+    @staticmethod
+    def _load_avatar_meta(meta_path: str) -> Dict:
+        """Read the avatar sidecar file written by download_avatar."""
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return {}
+
     def download_avatar(self, avatar_url: str, save_path: str) -> Optional[str]:
         """
         Download user's avatar from GitHub and save it locally.
@@ -190,25 +350,56 @@ class GithubFetchManager:
                 return None
                 
             # Determine file extension from URL (usually .png or .jpg)
-            file_extension = "png"  # Default to png
+            file_extension = None
             if "?" in avatar_url:
                 avatar_url = avatar_url.split("?")[0]  # Remove URL parameters
             if "." in avatar_url.split("/")[-1]:
                 file_extension = avatar_url.split(".")[-1]
-                
+
             # Extract username from save_path
             username = os.path.basename(save_path)
-            avatar_filename = f"{username}_avatar.{file_extension}"
-            avatar_path = os.path.join(save_path, avatar_filename)
-            
-            # Download avatar using requests
-            response = requests.get(avatar_url, stream=True)
-            response.raise_for_status()
-            
-            with open(avatar_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    
+
+            # Previous download is recorded in a sidecar file, ask only for a newer image
+            meta_path = os.path.join(save_path, f"{username}_avatar.meta")
+            previous = self._load_avatar_meta(meta_path)
+            headers = {}
+            if (
+                previous.get("last_modified")
+                and previous.get("filename")
+                and os.path.exists(os.path.join(save_path, previous["filename"]))
+            ):
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+            # Download avatar over the shared API session (no auth headers)
+            with self.api_utils.get_session().get(
+                avatar_url, stream=True, headers=headers
+            ) as response:
+                response.raise_for_status()
+
+                if response.status_code == 304:
+                    logging.info(f"Avatar not modified, keeping {previous['filename']}")
+                    return previous["filename"]
+
+                # avatars.githubusercontent.com URLs carry no extension, use the served type
+                if not file_extension:
+                    content_type = response.headers.get("Content-Type", "")
+                    if content_type.startswith("image/"):
+                        file_extension = content_type.split(";")[0].split("/")[-1]
+                    else:
+                        file_extension = "png"  # Default to png
+
+                avatar_filename = f"{username}_avatar.{file_extension}"
+                avatar_path = os.path.join(save_path, avatar_filename)
+
+                response.raw.decode_content = True
+                with open(avatar_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=64 * 1024)
+
+                last_modified = response.headers.get("Last-Modified")
+
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({"filename": avatar_filename, "last_modified": last_modified}, f)
+
             logging.info(f"Avatar saved to {avatar_path}")
             return avatar_filename
             
@@ -1,15 +1,45 @@
 import logging
-from typing import Dict, List, Any, Optional
+import re
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 from dateutil import parser
 import requests
 from .fetch import GithubFetchManager
 from ..utils.data import POPULAR_COMMIT_MESSAGES
 
+
+# Word tokens as GitHub search sees them, punctuation is ignored
+_WORD = re.compile(r"\w+")
+
+
+def _parse_iso_date(value: str) -> datetime:
+    """Parse GitHub and git ISO 8601 timestamps, falling back to dateutil."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parser.parse(value)
+
+
 class GitHubDataFilter:
     """Comparative analysis filters for potential fake Github profiles"""
+
+    # GitHub search caps queries at 256 characters and 5 boolean operators
+    MAX_QUERY_LENGTH = 256
+    MAX_BATCH_PHRASES = 5
+    # Shorter messages are not distinctive enough to search for
+    MIN_MESSAGE_LENGTH = 6
+    MIN_MESSAGE_WORDS = 5
+    # Only the start of the subject line is searched, it is what gets copied
+    MAX_MESSAGE_LENGTH = 120
     
     def __init__(self, github_fetch: GithubFetchManager):
         self.github_fetch = github_fetch
+        # Single-message search results by cleaned message, boilerplate messages
+        # repeat across repositories and are only searched once per run
+        self._search_memo = {}
         
     def filter_by_creation_date(
         self, 
@@ -26,12 +56,12 @@ class GitHubDataFilter:
         Returns:
             List of repositories with suspicious commit dates
         """
-        account_date = parser.parse(account_created_at)
+        account_date = _parse_iso_date(account_created_at)
         date_filter = []
         
         for repo_name, commits in commits_data.items():
             if commits:
-                first_commit_date = parser.parse(
+                first_commit_date = _parse_iso_date(
                     commits[-1]["commit"]["author"]["date"]
                 )
                 if first_commit_date < account_date:
@@ -58,80 +88,213 @@ class GitHubDataFilter:
         Returns:
             List of commits with matching messages in other repositories
         """
-        commit_filter = []
-        
         if repo_name:
-            if repo_name in commits_data:
-                filtered_commits = self._process_repo_commits(repo_name, commits_data[repo_name])
-                commit_filter.extend(filtered_commits)
-            else:
-                commit_filter.append({
+            if repo_name not in commits_data:
+                return [{
                     "target_repo": repo_name,
                     "target_commit": "Repository not found",
                     "search_results": 0,
                     "matching_repos": [],
-                })
+                }]
+            repos = {repo_name: commits_data[repo_name]}
         else:
-            for repo_name, commits in commits_data.items():
-                if commits:
-                    filtered_commits = self._process_repo_commits(repo_name, commits)
-                    commit_filter.extend(filtered_commits)
-                else:
-                    commit_filter.append({
-                        "target_repo": repo_name,
-                        "target_commit": "No commits found",
-                        "search_results": 0,
-                        "matching_repos": [],
-                    })
-                
+            repos = commits_data
+
+        # Index messages locally first, a message shared by several of the user's
+        # repositories is searched once and its result reused for the others
+        message_repos = {}
+        search_jobs = []
+        for target_repo, commits in repos.items():
+            if commits or repo_name:
+                new_messages = []
+                for message in self._repo_search_messages(commits):
+                    if message not in message_repos:
+                        message_repos[message] = [target_repo]
+                        new_messages.append(message)
+                    elif target_repo not in message_repos[message]:
+                        message_repos[message].append(target_repo)
+                search_jobs.extend(
+                    (target_repo, batch) for batch in self._batch_messages(new_messages)
+                )
+            else:
+                # A None batch marks a repository without commits
+                search_jobs.append((target_repo, None))
+
+        # Searches are latency-bound, run them concurrently (APIUtils throttles /search)
+        commit_filter = []
+        with ThreadPoolExecutor(
+            max_workers=self.github_fetch.api_utils.MAX_WORKERS
+        ) as executor:
+            for results in executor.map(self._run_search_job, search_jobs):
+                for result in results:
+                    commit_filter.append(result)
+                    for other_repo in message_repos.get(result["target_commit"], [])[1:]:
+                        commit_filter.append(dict(result, target_repo=other_repo))
+
         return commit_filter
-    
-    def _process_repo_commits(
-        self, 
-        repo_name: str, 
-        commits: List[Dict]
-    ) -> List[Dict]:
-        """
-        Process commits from a single repository for filtering.
-        Checks all commits for similarity matches.
-        """
-        filtered_commits = []
-        
+
+    def _repo_search_messages(self, commits: List[Dict]) -> List[str]:
+        """Collect cleaned searchable messages of a repository."""
+        messages = []
         for commit in commits:
             commit_message = commit["commit"]["message"]
             if self._valid_target_search(commit_message):
-                cleaned_message = self._clean_commit_message(commit_message)
-                search_result = self._search_similar_commits(
-                    repo_name, 
-                    cleaned_message
-                )
-                if search_result is not None:
-                    filtered_commits.append(search_result)
-                    logging.info(
-                        f"Found {search_result['search_results']} matches for commit in {repo_name}: "
-                        f"{commit_message[:100]}..."
-                    )
+                messages.append(self._clean_commit_message(commit_message))
             else:
-                logging.info(f"Too popular commit to search, skipping message: {commit_message}")
-                    
-        return filtered_commits
-    
+                logging.info(f"Too short or popular commit to search, skipping message: {commit_message}")
+
+        return messages
+
+    def _run_search_job(self, job: Tuple[str, Optional[List[str]]]) -> List[Dict]:
+        """Search one batch of messages from a repository."""
+        repo_name, batch = job
+        if batch is None:
+            return [{
+                "target_repo": repo_name,
+                "target_commit": "No commits found",
+                "search_results": 0,
+                "matching_repos": [],
+            }]
+
+        if len(batch) == 1:
+            search_result = self._search_similar_commits(repo_name, batch[0])
+            search_results = [search_result] if search_result is not None else []
+        else:
+            search_results = self._search_similar_commits_batch(repo_name, batch)
+
+        for search_result in search_results:
+            logging.info(
+                f"Found {search_result['search_results']} matches for commit in {repo_name}: "
+                f"{search_result['target_commit'][:100]}..."
+            )
+
+        return search_results
+
+    def _batch_messages(self, messages: List[str]) -> List[List[str]]:
+        """Group messages into OR-queries that fit GitHub's search query limits."""
+        batches = []
+        batch = []
+        batch_length = 0
+        for message in messages:
+            phrase_length = len(message) + 2  # quotes
+            separator_length = len(" OR ") if batch else 0
+            if batch and (
+                len(batch) >= self.MAX_BATCH_PHRASES
+                or batch_length + separator_length + phrase_length > self.MAX_QUERY_LENGTH
+            ):
+                batches.append(batch)
+                batch = []
+                batch_length = 0
+                separator_length = 0
+            batch.append(message)
+            batch_length += separator_length + phrase_length
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _search_similar_commits_batch(
+        self,
+        repo_name: str,
+        messages: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Search several commit messages with one "m1" OR "m2" query and assign
+        returned commits back to the message they contain. When the result is
+        truncated the assignment would be incomplete, so fall back to one
+        search per message.
+        """
+        try:
+            search_url = f"{self.github_fetch.api_utils.GITHUB_API_URL}/search/commits"
+            search_params = {
+                "q": " OR ".join(f'"{message}"' for message in messages),
+                "per_page": self.github_fetch.api_utils.ITEMS_PER_PAGE,
+            }
+
+            search_results, _ = self.github_fetch.api_utils.github_api_request(
+                search_url,
+                params=search_params,
+                cache=True,
+            )
+
+            if not search_results:
+                return []
+
+            items = search_results.get("items", [])
+            if search_results.get("total_count", 0) > len(items):
+                single_results = [
+                    self._search_similar_commits(repo_name, message)
+                    for message in messages
+                ]
+                return [result for result in single_results if result is not None]
+
+            # Every returned commit is here, so the hits assigned to a message are
+            # its full match count, the same number total_count gives a single search
+            normalized = {message: self._normalize_message(message) for message in messages}
+            matches = {message: [] for message in messages}
+            for item in items:
+                html_url = item.get("repository", {}).get("html_url")
+                if not html_url:
+                    continue
+                item_message = self._normalize_message(
+                    item.get("commit", {}).get("message", "")
+                )
+                for message, phrase in normalized.items():
+                    if phrase in item_message:
+                        matches[message].append(
+                            self.github_fetch.api_utils.github_path(html_url).lstrip("/")
+                        )
+
+            return [
+                {
+                    "target_repo": repo_name,
+                    "target_commit": message,
+                    "search_results": len(matching_repos),
+                    "matching_repos": matching_repos,
+                }
+                for message, matching_repos in matches.items()
+                if matching_repos
+            ]
+
+        except requests.exceptions.HTTPError as e:
+            logging.error(f"Error fetching batched search results for {repo_name}: {e}")
+        except Exception as e:
+            logging.error(f"Unexpected error searching commits: {e}")
+
+        return []
+
     def _search_similar_commits(
         self, 
         repo_name: str, 
         commit_message: str
+    ) -> Dict[str, Any]:
+        """Search for similar commit messages, reusing results of identical messages."""
+        if commit_message not in self._search_memo:
+            self._search_memo[commit_message] = self._fetch_similar_commits(
+                repo_name, commit_message
+            )
+
+        search_result = self._search_memo[commit_message]
+        if search_result is None:
+            return None
+        return dict(search_result, target_repo=repo_name)
+
+    def _fetch_similar_commits(
+        self, 
+        repo_name: str, 
+        commit_message: str
     ) -> Dict[str, Any]:
         """Search for similar commit messages across GitHub."""
         try:
             search_url = f"{self.github_fetch.api_utils.GITHUB_API_URL}/search/commits"
             search_params = {
-                "q": commit_message,
+                "q": f'"{commit_message}"',
                 "per_page": self.github_fetch.api_utils.ITEMS_PER_PAGE,
             }
             
             search_results, _ = self.github_fetch.api_utils.github_api_request(
                 search_url, 
-                params=search_params
+                params=search_params,
+                cache=True,
             )
             
             if not search_results:
@@ -140,9 +303,9 @@ class GitHubDataFilter:
             total_count = search_results.get("total_count", 0)
             if total_count > 0:
                 matching_repos = [
-                    item["repository"]["html_url"].replace(
-                        "https://github.com/", ""
-                    )
+                    self.github_fetch.api_utils.github_path(
+                        item["repository"]["html_url"]
+                    ).lstrip("/")
                     for item in search_results["items"]
                     if item.get("repository", {}).get("html_url")
                 ]
@@ -163,10 +326,29 @@ class GitHubDataFilter:
         return None
     
     def _valid_target_search(self, message: str) -> bool:
-        """Check if commit message length is within valid range."""
-        cleaned_message = message.strip()
-        return cleaned_message not in POPULAR_COMMIT_MESSAGES
+        """Check if commit message is long enough and not a popular one."""
+        cleaned_message = self._clean_commit_message(message)
+        if len(cleaned_message) < self.MIN_MESSAGE_LENGTH:
+            return False
+        if len(cleaned_message.split()) < self.MIN_MESSAGE_WORDS:
+            return False
+        return cleaned_message.lower() not in POPULAR_COMMIT_MESSAGES
     
     def _clean_commit_message(self, message: str) -> str:
-        """Clean commit message by removing newlines."""
-        return message.replace("\n", " ").replace("\r", " ")
+        """
+        Reduce commit message to its subject line without quotes (used for phrase search),
+        cut on a word boundary to keep queries under GitHub's length limit.
+        """
+        subject = " ".join(message.strip().split("\n", 1)[0].replace('"', " ").split())
+        if len(subject) > self.MAX_MESSAGE_LENGTH:
+            subject = subject[:self.MAX_MESSAGE_LENGTH].rsplit(" ", 1)[0]
+        return subject
+
+    @staticmethod
+    def _normalize_message(message: str) -> str:
+        """
+        Reduce a message to its lowercase words for comparing search hits to messages.
+        Phrase search ignores punctuation, so "Fix: update" also matches "fix update".
+        Padded with spaces so a phrase only matches whole words.
+        """
+        return f" {' '.join(_WORD.findall(message.lower()))} "
@@ -1,16 +1,57 @@
+import os
+import sys
+import json
 import time
+import heapq
 import logging
-from datetime import datetime, timedelta
+import operator
+import tempfile
 from ..utils.config import setup_logging, MONITOR_SLEEP
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from typing import Any, List, Dict, Tuple, Optional, FrozenSet, Iterator
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
 from .fetch import GithubFetchManager
+from ..utils.cache import DEFAULT_CACHE_DIR
 
-@dataclass
+MONITOR_STATE_FILE = os.path.join(os.path.dirname(DEFAULT_CACHE_DIR), "monitor_state.json")
+
+# Event type -> description template, fields are filled with str.format_map
+_EVENT_TEMPLATES = {
+    "WatchEvent": "{actor} starred the repository {repo}",
+    "PushEvent": "{actor} pushed to {repo}. Commits: {commit_count}",
+    "CreateEvent": "{actor} created a {ref_type} in {repo}",
+    "DeleteEvent": "{actor} deleted a {ref_type} in {repo}",
+    "ForkEvent": "{actor} forked {repo}",
+    "IssuesEvent": "{actor} {action} an issue in {repo}",
+    "IssueCommentEvent": "{actor} commented on an issue in {repo}",
+    "PullRequestEvent": "{actor} {action} a pull request in {repo}",
+    "PullRequestReviewEvent": "{actor} reviewed a pull request in {repo}",
+    "PullRequestReviewCommentEvent": "{actor} commented on a pull request review in {repo}",
+    "CommitCommentEvent": "{actor} commented on a commit in {repo}",
+    "ReleaseEvent": "{actor} {action} a release in {repo}",
+    "PublicEvent": "{actor} made {repo} public",
+    "MemberEvent": "{actor} {action} a member in {repo}",
+    "GollumEvent": "{actor} updated the wiki in {repo}",
+}
+
+# Profile fields compared between monitor checks
+_PROFILE_FIELDS = (
+    "name", "company", "blog", "location", "email",
+    "bio", "twitter_username", "updated_at"
+)
+_get_profile_fields = operator.attrgetter(*_PROFILE_FIELDS)
+
+# Default of monitor_user_changes, None means a prefetch was made and failed
+_NOT_FETCHED = object()
+
+# dataclass slots are only supported from Python 3.10
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class UserEventData:
     etag: Optional[str] = None
-    last_check: Optional[datetime] = None
-    last_info_check: Optional[datetime] = None
+    last_check: Optional[float] = None  # epoch seconds
+    last_info_check: Optional[float] = None
     following_count: int = 0
     name: Optional[str] = None
     company: Optional[str] = None
@@ -20,11 +61,17 @@ class UserEventData:
     bio: Optional[str] = None
     twitter_username: Optional[str] = None
     updated_at: Optional[str] = None
+    poll_interval: int = 60
+    following_logins: Optional[FrozenSet[str]] = None
+    failures: int = 0
 
 class GitHubMonitor:
-    def __init__(self, api_utils):
+    # Longest wait in seconds between polls of a failing user
+    MAX_BACKOFF = 3600
+
+    def __init__(self, api_utils, github_fetch: Optional[GithubFetchManager] = None):
         self.api_utils = api_utils
-        self.github_fetch = GithubFetchManager(api_utils)
+        self.github_fetch = github_fetch or GithubFetchManager(api_utils)
         setup_logging("monitoring.log")
         self.logger = logging.getLogger('monitoring')
         
@@ -32,31 +79,22 @@ class GitHubMonitor:
     def interpret_event(event: Dict) -> str:
         """Convert a GitHub event into a human-readable description."""
         event_type = event.get("type")
-        actor = event.get("actor", {}).get("login")
-        repo = event.get("repo", {}).get("name")
-        payload = event.get("payload", {})
+        template = _EVENT_TEMPLATES.get(event_type)
+        if template is None:
+            return f"Unknown event type: {event_type}"
 
-        interpretations = {
-            "WatchEvent": f"{actor} starred the repository {repo}",
-            "PushEvent": f"{actor} pushed to {repo}. Commits: {len(payload.get('commits', []))}",
-            "CreateEvent": f"{actor} created a {payload.get('ref_type')} in {repo}",
-            "DeleteEvent": f"{actor} deleted a {payload.get('ref_type')} in {repo}",
-            "ForkEvent": f"{actor} forked {repo}",
-            "IssuesEvent": f"{actor} {payload.get('action')} an issue in {repo}",
-            "IssueCommentEvent": f"{actor} commented on an issue in {repo}",
-            "PullRequestEvent": f"{actor} {payload.get('action')} a pull request in {repo}",
-            "PullRequestReviewEvent": f"{actor} reviewed a pull request in {repo}",
-            "PullRequestReviewCommentEvent": f"{actor} commented on a pull request review in {repo}",
-            "CommitCommentEvent": f"{actor} commented on a commit in {repo}",
-            "ReleaseEvent": f"{actor} {payload.get('action')} a release in {repo}",
-            "PublicEvent": f"{actor} made {repo} public",
-            "MemberEvent": f"{actor} {payload.get('action')} a member in {repo}",
-            "GollumEvent": f"{actor} updated the wiki in {repo}",
+        payload = event.get("payload", {})
+        fields = {
+            "actor": event.get("actor", {}).get("login"),
+            "repo": event.get("repo", {}).get("name"),
+            "action": payload.get("action"),
+            "ref_type": payload.get("ref_type"),
         }
-
-        return interpretations.get(event_type, f"Unknown event type: {event_type}")
+        if event_type == "PushEvent":
+            fields["commit_count"] = len(payload.get("commits", []))
+        return template.format_map(fields)
         
-    def fetch_user_events(self, username: str, etag: Optional[str] = None) -> Tuple[List[Dict], Optional[str], int]:
+    def fetch_user_events(self, username: str, etag: Optional[str] = None) -> Tuple[List[Dict], Optional[str], Optional[int]]:
         return self.github_fetch.fetch_user_events(username, etag)
     
     def fetch_user_info(self, username: str) -> Dict:
@@ -65,54 +103,71 @@ class GitHubMonitor:
     def fetch_user_following(self, username: str) -> List[Dict]:
         return self.github_fetch.fetch_following(username)
 
-    def process_events(self, events: List[Dict]) -> List[Dict]:
-        """Process raw GitHub events into a standardized format."""
-        if not events:
-            return []
-
-        return [{
-            "type": event.get("type"),
-            "target": event.get("repo", {}).get("name"),
-            "date": event.get("created_at"),
-            "description": self.interpret_event(event)
-        } for event in events]
+    def process_events(self, events: List[Dict]) -> Iterator[Dict]:
+        """Process raw GitHub events into a standardized format, one at a time."""
+        for event in events or ():
+            yield {
+                "type": event.get("type"),
+                "target": event.get("repo", {}).get("name"),
+                "date": event.get("created_at"),
+                "description": self.interpret_event(event)
+            }
 
     def recent_events(self, username: str) -> List[Dict]:
-        """Fetch and process events from the last specified number of days."""
+        """Fetch and process the user's recent public events."""
         events, _, _ = self.fetch_user_events(username)
         if not events:
             return []
         
-        return self.process_events(events)
+        return list(self.process_events(events))
+
+    @staticmethod
+    def _profile_check_due(user_data: UserEventData, current_time: float) -> bool:
+        """Profile and following are checked every MONITOR_SLEEP minutes."""
+        return user_data.last_info_check is None or (
+            current_time - user_data.last_info_check > MONITOR_SLEEP * 60
+        )
 
-    def monitor_user_changes(self, username: str, user_data: UserEventData) -> List[str]:
-        """Monitor changes in user profile and following."""
-        current_time = datetime.now()
+    def monitor_user_changes(
+        self, username: str, user_data: UserEventData, user_info: Any = _NOT_FETCHED
+    ) -> List[str]:
+        """
+        Monitor changes in user profile and following, user_info may be prefetched.
+        A failed prefetch (None) counts as this check and is not fetched again.
+        """
+        current_time = time.time()
         changes = []
         
-        if user_data.last_info_check is None or (
-            current_time - user_data.last_info_check > timedelta(minutes=MONITOR_SLEEP)
-        ):
-            user_info = self.fetch_user_info(username)
+        if user_info is not _NOT_FETCHED or self._profile_check_due(user_data, current_time):
+            if user_info is _NOT_FETCHED:
+                user_info = self.fetch_user_info(username)
             if user_info:
-                # Check for new following
+                # Check for new following, the list is only fetched when the count
+                # or the profile changed (a conditional request, 304 when unchanged)
                 new_following_count = user_info.get("following", 0)
-                if new_following_count > user_data.following_count:
-                    new_following = self.fetch_user_following(username)
-                    for followed in new_following[:new_following_count - user_data.following_count]:
-                        changes.append(f"User: {username} is now following {followed['login']}")
+                if (
+                    new_following_count != user_data.following_count
+                    or user_info.get("updated_at") != user_data.updated_at
+                ):
+                    # Diff login sets, a count delta misses unfollow + follow pairs
+                    following_logins = frozenset(
+                        followed["login"] for followed in self.fetch_user_following(username)
+                    )
+                    previous_logins = user_data.following_logins or frozenset()
+                    for login in sorted(following_logins - previous_logins):
+                        changes.append(f"User: {username} is now following {login}")
+                    for login in sorted(previous_logins - following_logins):
+                        changes.append(f"User: {username} is no longer following {login}")
+                    user_data.following_logins = following_logins
                     user_data.following_count = new_following_count
 
-                # Check profile changes
-                fields_to_check = [
-                    "name", "company", "blog", "location", "email", 
-                    "bio", "twitter_username", "updated_at"
-                ]
-                
-                for field in fields_to_check:
-                    new_value = user_info.get(field)
-                    old_value = getattr(user_data, field)
-                    if new_value != old_value:
+                # Check profile changes, compare all fields at once before diffing
+                new_values = tuple(user_info.get(field) for field in _PROFILE_FIELDS)
+                old_values = _get_profile_fields(user_data)
+                if new_values != old_values:
+                    for field, old_value, new_value in zip(_PROFILE_FIELDS, old_values, new_values):
+                        if new_value == old_value:
+                            continue
                         if field == "updated_at":
                             changes.append(f"User: {username} profile was updated at {new_value}")
                         else:
@@ -126,42 +181,146 @@ class GitHubMonitor:
             
         return changes
 
+    def _load_state(self, path: str = MONITOR_STATE_FILE) -> Dict[str, UserEventData]:
+        """Load persisted per-user state, stored ETags let a restart resume with 304s."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        state = {}
+        for username, fields in saved.items():
+            try:
+                if fields.get("following_logins") is not None:
+                    fields["following_logins"] = frozenset(fields["following_logins"])
+                state[username] = UserEventData(**fields)
+            except (TypeError, ValueError) as e:
+                self.logger.debug("Ignoring saved monitor state of %s: %s", username, e)
+        return state
+
+    def _save_state(self, state: Dict[str, UserEventData], path: str = MONITOR_STATE_FILE) -> None:
+        """Write per-user state atomically so an interrupted write keeps the old file."""
+        saved = {}
+        for username, data in state.items():
+            fields = asdict(data)
+            if fields["following_logins"] is not None:
+                fields["following_logins"] = sorted(fields["following_logins"])
+            saved[username] = fields
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(saved, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.debug("Could not save monitor state to %s: %s", path, e)
+
+    def _log_events(self, username: str, events: List[Dict]) -> None:
+        """Log raw events in one pass, without building process_events records."""
+        log = self.logger.info
+        interpret_event = self.interpret_event
+        for event in events:
+            log("User: %s, %s, Date: %s", username, interpret_event(event), event.get("created_at"))
+
+    def poll_user(
+        self,
+        username: str,
+        data: UserEventData,
+        info_executor: Optional[ThreadPoolExecutor] = None,
+    ) -> int:
+        """
+        Log new events and profile changes of a user, returns the poll interval.
+        With info_executor the profile is fetched alongside the events when due.
+        """
+        current_time = time.time()
+
+        # Check for new events, on a profile check tick fetch the profile alongside
+        info_future = (
+            info_executor.submit(self.fetch_user_info, username)
+            if info_executor is not None and self._profile_check_due(data, current_time)
+            else None
+        )
+        events, new_etag, poll_interval = self.fetch_user_events(username, etag=data.etag)
+        user_info = info_future.result() if info_future else _NOT_FETCHED
+
+        data.etag = new_etag or data.etag
+        data.last_check = current_time
+        if poll_interval is None:
+            # Failed request, back off exponentially until the next answer
+            data.failures += 1
+            poll_interval = min(
+                self.MAX_BACKOFF, data.poll_interval * 2 ** data.failures
+            )
+            self.logger.warning(
+                "Fetching events of %s failed, retrying in %ss", username, poll_interval
+            )
+        else:
+            data.failures = 0
+            if poll_interval != data.poll_interval:
+                self.logger.debug("Poll interval for %s is now %ss", username, poll_interval)
+                data.poll_interval = poll_interval
+
+        self._log_events(username, events)
+
+        # Check for profile changes
+        log = self.logger.info
+        for change in self.monitor_user_changes(username, data, user_info):
+            log(change)
+
+        return poll_interval
+
     def monitor(self, targets: List[str]) -> None:
         """Live monitor GitHub activity for specified users."""
         if not targets:
             self.logger.info("No target(s) for monitor specified")
             return
 
-        user_data = {username: UserEventData() for username in targets}
+        # Resume from the last run, state of users not monitored now is kept on disk
+        state = self._load_state()
+        user_data = {
+            username: state.get(username) or UserEventData() for username in targets
+        }
+        state.update(user_data)
         
-        self.logger.info(f"Starting to monitor activity for users: {', '.join(targets)}")
+        self.logger.info("Starting to monitor activity for users: %s", ", ".join(targets))
         self.logger.info("Press Ctrl+C to stop monitoring.")
 
+        # Each user is polled on its own X-Poll-Interval, soonest due first
+        schedule = [(time.monotonic(), username) for username in targets]
+        heapq.heapify(schedule)
+
         try:
-            while True:
-                for username in targets:
-                    current_time = datetime.now()
-                    data = user_data[username]
-
-                    # Check for new events
-                    events, new_etag, poll_interval = self.fetch_user_events(
-                        username, etag=data.etag
-                    )
-                    
-                    data.etag = new_etag
-                    data.last_check = current_time
+            # Polls are I/O-bound, users due at the same time are checked concurrently.
+            # Profiles are prefetched on a second pool, polls block on their result
+            workers = min(self.api_utils.MAX_WORKERS, len(targets))
+            with ThreadPoolExecutor(max_workers=workers) as executor, ThreadPoolExecutor(
+                max_workers=workers
+            ) as info_executor:
+                while True:
+                    time.sleep(max(0, schedule[0][0] - time.monotonic()))
 
-                    if events:
-                        processed_events = self.process_events(events)
-                        for event in processed_events:
-                            self.logger.info(f"User: {username}, {event['description']}, Date: {event['date']}")
+                    now = time.monotonic()
+                    due_users = []
+                    while schedule and schedule[0][0] <= now:
+                        due_users.append(heapq.heappop(schedule)[1])
+
+                    poll_intervals = list(
+                        executor.map(
+                            lambda username: self.poll_user(
+                                username, user_data[username], info_executor
+                            ),
+                            due_users,
+                        )
+                    )
 
-                    # Check for profile changes
-                    changes = self.monitor_user_changes(username, data)
-                    for change in changes:
-                        self.logger.info(change)
+                    polled_at = time.monotonic()
+                    for username, poll_interval in zip(due_users, poll_intervals):
+                        heapq.heappush(schedule, (polled_at + poll_interval, username))
 
-                    time.sleep(poll_interval)
+                    self._save_state(state)
 
         except KeyboardInterrupt:
+            self._save_state(state)
             self.logger.info("Stopping user activity monitoring.")
@@ -1,6 +1,8 @@
 import os
+import sys
 import json
 import logging
+from functools import lru_cache
 from ..utils.data import DataManager
 
 
@@ -22,29 +24,56 @@ def format_value(value, indent=0):
         if not value:
             return "[]"
 
-        # Check if list contains dictionaries
+        # Lists of dictionaries are encoded in one pass, json indents nested items
         if any(isinstance(item, dict) for item in value):
-            items = [f"{indent_str}  {json.dumps(item, indent=2)}" for item in value]
-            return "[\n" + ",\n".join(items) + f"\n{indent_str}]"
+            return json.dumps(value, indent=2)
 
         # For simple lists, format them more compactly but still readable
-        items = [f"{indent_str}  {json.dumps(item)}" for item in value]
-        return "[\n" + ",\n".join(items) + f"\n{indent_str}]"
+        item_indent = f"{indent_str}  "
+        body = (",\n" + item_indent).join(_dumps_scalar(item) for item in value)
+        return f"[\n{item_indent}{body}\n{indent_str}]"
 
     elif isinstance(value, dict):
         return json.dumps(value, indent=2)
 
+    return _dumps_scalar(value)
+
+
+def _dumps_scalar(value):
+    """json.dumps for a single value, skipping the encoder for common leaves."""
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is int:
+        return str(value)
+    # Plain ASCII without quotes, backslashes or control characters needs no escaping
+    if (
+        type(value) is str
+        and value.isascii()
+        and value.isprintable()
+        and '"' not in value
+        and "\\" not in value
+    ):
+        return f'"{value}"'
     return json.dumps(value)
 
 
+@lru_cache(maxsize=256)
+def _split_key_path(key_path):
+    """Split a dotted key path once per distinct path."""
+    return tuple(key_path.split("."))
+
+
 def get_nested_value(data, key_path):
     """
     Retrieve nested dictionary value using dot notation
     Example: profile_info.login -> data['profile_info']['login']
     """
-    keys = key_path.split(".")
     value = data
-    for key in keys:
+    for key in _split_key_path(key_path):
         if isinstance(value, dict):
             value = value.get(key)
         else:
@@ -52,43 +81,67 @@ def get_nested_value(data, key_path):
     return value
 
 
+# Colored summary labels, built once at import
+_LABELS = {
+    label: f"{Colors.BLUE}{label}:{Colors.RESET} "
+    for label in (
+        "Name", "URL", "Created At", "Updated At", "Followers", "Following",
+        "Mutual Following", "Repositories", "Forked Repositories",
+        "Pull Requests", "Unique Emails", "Issues Opened", "Comments Made",
+    )
+}
+_COPY_WARNING = (
+    f"\n{Colors.RED}WARNING: Profile contains potentially copied repository{Colors.RESET}"
+)
+_UNIQUE_COMMIT_INFO = f"{Colors.YELLOW}INFO: Unique commit message found in:{Colors.RESET} "
+_MESSAGE_LABEL = f" {Colors.YELLOW}message:{Colors.RESET} "
+
+
 def print_summary(data):
     """Print top-level summary of profile data"""
-    print(f"{Colors.BLUE}Name:{Colors.RESET} {data['profile_info']['name']}")
-    print(f"{Colors.BLUE}URL:{Colors.RESET} {data['profile_info']['html_url']}")
-    print(
-        f"{Colors.BLUE}Created At:{Colors.RESET} {data['profile_info']['created_at']}"
-    )
-    print(
-        f"{Colors.BLUE}Updated At:{Colors.RESET} {data['profile_info']['updated_at']}"
-    )
-    print(f"{Colors.BLUE}Followers:{Colors.RESET} {data['profile_info']['followers']}")
-    print(f"{Colors.BLUE}Following:{Colors.RESET} {data['profile_info']['following']}")
-    print(
-        f"{Colors.BLUE}Mutual Following:{Colors.RESET} {len(data['mutual_followers'])}"
-    )
-    print(f"{Colors.BLUE}Repositories:{Colors.RESET} {data['original_repos_count']}")
-    
-    print(
-        f"{Colors.BLUE}Forked Repositories:{Colors.RESET} {data['forked_repos_count']}"
-    )
-    print(f"{Colors.BLUE}Pull Requests:{Colors.RESET} {len(data['pull_requests_to_other_repos'])}")
-    print(f"{Colors.BLUE}Unique Emails:{Colors.RESET} {len(data['unique_emails'])}")
-    print(f"{Colors.BLUE}Issues Opened:{Colors.RESET} {len(data['issues'])}")
-    print(f"{Colors.BLUE}Comments Made:{Colors.RESET} {len(data['comments'])}")
-    
-    if "potential_copy" in data and data["potential_copy"]:
-        print(
-            f"\n{Colors.RED}WARNING: Profile contains potentially copied repository{Colors.RESET}"
-        )
-
-    if "commit_filter" in data and data["commit_filter"]:
-        for obj in data["commit_filter"]:
+    profile_info = data["profile_info"]
+    lines = [
+        _LABELS["Name"] + str(profile_info["name"]),
+        _LABELS["URL"] + str(profile_info["html_url"]),
+        _LABELS["Created At"] + str(profile_info["created_at"]),
+        _LABELS["Updated At"] + str(profile_info["updated_at"]),
+        _LABELS["Followers"] + str(profile_info["followers"]),
+        _LABELS["Following"] + str(profile_info["following"]),
+        _LABELS["Mutual Following"] + str(len(data["mutual_followers"])),
+        _LABELS["Repositories"] + str(data["original_repos_count"]),
+        _LABELS["Forked Repositories"] + str(data["forked_repos_count"]),
+        _LABELS["Pull Requests"] + str(len(data["pull_requests_to_other_repos"])),
+        _LABELS["Unique Emails"] + str(len(data["unique_emails"])),
+        _LABELS["Issues Opened"] + str(len(data["issues"])),
+        _LABELS["Comments Made"] + str(len(data["comments"])),
+    ]
+
+    if data.get("potential_copy"):
+        lines.append(_COPY_WARNING)
+
+    commit_filter = data.get("commit_filter")
+    if commit_filter:
+        repo_prefix = f"{_UNIQUE_COMMIT_INFO}{profile_info['login']}/"
+        for obj in commit_filter:
             if obj["search_results"] < 10:
-                print(
-                    f"{Colors.YELLOW}INFO: Unique commit message found in:{Colors.RESET} {data['profile_info']['login']}/{obj['target_repo']} {Colors.YELLOW}message:{Colors.RESET} {obj['target_commit']} "
+                lines.append(
+                    f"{repo_prefix}{obj['target_repo']}{_MESSAGE_LABEL}{obj['target_commit']} "
                 )
 
+    # Single write instead of one print per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+@lru_cache(maxsize=8)
+def _load_report(report_path, mtime_ns):
+    """
+    Decode report.json, memoized per (path, mtime) so repeated lookups on
+    an unchanged report skip parsing. The returned dict must not be modified.
+    """
+    # One read of the whole file, json.loads is faster than json.load on a stream
+    with open(report_path, "rb") as f:
+        return json.loads(f.read())
+
 
 def parse_report(username, key=None, summary=False, out_path=None):
     """Parse and display data from report.json"""
@@ -100,8 +153,7 @@ def parse_report(username, key=None, summary=False, out_path=None):
         return False
 
     try:
-        with open(report_path, "r") as f:
-            data = json.load(f)
+        data = _load_report(report_path, os.stat(report_path).st_mtime_ns)
 
         if summary:
             print(f"\n{Colors.GREEN}Summary for: { Colors.RESET}{username}")
@@ -1,73 +1,235 @@
 import argparse
+import re
 import time
 import logging
+import queue
+import threading
 from .modules.output import parse_report
 from .modules.analyze import GitHubProfileAnalyzer
 from .modules.monitor import GitHubMonitor
 from .utils.api import APIUtils
 from .modules.output import Colors
-from .utils.config import setup_logging, get_config_path, load_github_token
+from .utils.config import setup_logging, read_config_text, load_github_token
+
+# GitHub logins are up to 39 alphanumeric characters or hyphens, not starting with one
+GITHUB_USERNAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9-]{0,38}")
+
+
+def iter_targets(file_path):
+    """
+    Yield GitHub usernames from a file while it is read.
+    Blank lines and # comments are skipped, duplicates and invalid names dropped.
+    """
+    seen = set()
+    with open(file_path, "r") as file:
+        for line in file:
+            name = line.strip()
+            if not name or name.startswith("#"):
+                continue
+            if not GITHUB_USERNAME.fullmatch(name):
+                logging.warning("Skipping invalid GitHub username in %s: %s", file_path, name)
+                continue
+            # Logins are case-insensitive, keep the first spelling
+            login = name.lower()
+            if login not in seen:
+                seen.add(login)
+                yield name
 
 
 def read_targets(file_path):
     """Reads a list of GitHub usernames from a file."""
     try:
-        with open(file_path, "r") as file:
-            targets = file.read().splitlines()
+        targets = list(iter_targets(file_path))
         if targets:
-            logging.info(f"Targets read from {file_path}")
+            logging.info("Targets read from %s", file_path)
         return targets
     except Exception as e:
-        logging.error(f"Error reading targets file {file_path}: {e}")
+        logging.error("Error reading targets file %s: %s", file_path, e)
         return []
 
 
+def run_targets(targets, handle, workers=1):
+    """
+    Pass targets to worker threads through a bounded queue while they are read,
+    so the first targets are processed before a large file has been parsed.
+    Returns the number of targets handled.
+    """
+    pending = queue.Queue(maxsize=workers * 4)
+    stop = threading.Event()
+    failures = []
+
+    def put(item):
+        """Queue an item, False when the run was stopped while waiting for a slot."""
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker():
+        while not stop.is_set():
+            try:
+                target = pending.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            # Queued targets are abandoned once the run is stopped
+            if target is None or stop.is_set():
+                return
+            try:
+                handle(target)
+            except Exception as e:
+                logging.error("Error processing target %s: %s", target, e)
+            except BaseException as e:
+                # exit() on a fatal API error (e.g. bad token) ends the whole run
+                failures.append(e)
+                stop.set()
+                return
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    count = 0
+    interrupted = False
+    try:
+        for target in targets:
+            if not put(target):
+                break
+            count += 1
+        # One stop marker per worker, workers also leave on their own once stopped
+        for _ in threads:
+            if not put(None):
+                break
+    except BaseException:
+        interrupted = True
+        stop.set()
+        raise
+    finally:
+        if not interrupted:
+            for thread in threads:
+                thread.join()
+
+    if failures:
+        raise failures[0]
+    return count
+
+
 def process_target(username, commit_search=None, only_profile=False, out_path=None):
     try:
         analyzer = GitHubProfileAnalyzer(username, out_path=out_path)
 
         if only_profile:
-            logging.info(f"Only fetching profile data for {username}...")
+            logging.info("Only fetching profile data for %s...", username)
             analyzer.fetch_profile_data()
             analyzer.data_manager.save_output(analyzer.data)
             return
 
         if commit_search:
             logging.info(
-                f"Searching for copied commits {'in ' + commit_search if isinstance(commit_search, str) else 'across all repos'}..."
+                "Searching for copied commits %s...",
+                "in " + commit_search if isinstance(commit_search, str) else "across all repos",
             )
 
             if analyzer.data:
-                logging.info(f"Profile data exists. Running filter commit search.")
+                logging.info("Profile data exists. Running filter commit search.")
                 analyzer.filter_commit_search(
                     repo_name=commit_search if isinstance(commit_search, str) else None
                 )
                 return
             else:
                 logging.info(
-                    f"Profile data not found. Running analysis before commit search."
+                    "Profile data not found. Running analysis before commit search."
                 )
                 analyzer.run_analysis()
-                logging.info(f"Analysis done. Running filter commit search.")
+                logging.info("Analysis done. Running filter commit search.")
                 analyzer.filter_commit_search(
                     repo_name=commit_search if isinstance(commit_search, str) else None
                 )
-                logging.info(f"Generating report for {username}...")
+                logging.info("Generating report for %s...", username)
                 analyzer.generate_report()
-                logging.info(f"Processing completed for {username}")
+                logging.info("Processing completed for %s", username)
                 return
         else:
-            logging.info(f"Starting full analysis for {username}...")
+            logging.info("Starting full analysis for %s...", username)
             analyzer.run_analysis()
 
-            logging.info(f"Generating report for {username}...")
+            logging.info("Generating report for %s...", username)
             analyzer.generate_report()
 
-            logging.info(f"Processing completed for {username}")
+            logging.info("Processing completed for %s", username)
             return
 
     except Exception as e:
-        logging.error(f"Error processing target {username}: {e}")
+        logging.error("Error processing target %s: %s", username, e)
+
+
+def run_monitor_mode(args):
+    """Watch events of the username and/or targets file users until interrupted."""
+    targets = [args.username] if args.username else []
+    if args.targets:
+        targets.extend(read_targets(args.targets))
+    if not targets:
+        logging.error("No targets found to monitor. Exiting.")
+        return
+    GitHubMonitor(APIUtils).monitor(list(dict.fromkeys(targets)))
+
+
+def run_only_profile_mode(args):
+    """Fetch and save only the profile data of the username."""
+    logging.info("Only fetching profile data for %s...", args.username)
+    process_target(args.username, only_profile=True, out_path=args.out_path)
+
+
+def run_analysis_mode(args):
+    """Run the full analysis (or commit search) for the username and targets file."""
+    start_time = time.time()
+
+    # The config is only read to be logged, skip it when INFO is filtered
+    if (args.username or args.targets) and logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("Config: \n%s", read_config_text())
+
+    if args.username:
+        logging.info("Processing single target: %s", args.username)
+        
+        process_target(args.username, args.commit_search, out_path=args.out_path)
+
+    if args.targets:
+        targets_file = args.targets
+        
+        logging.info("Processing targets from file: %s", targets_file)
+
+        def run_target(target):
+            logging.info("Processing target: %s", target)
+            process_target(target, args.commit_search, out_path=args.out_path)
+
+        # Targets are I/O-bound, overlap their API requests (pool sized in terminal())
+        try:
+            count = run_targets(iter_targets(targets_file), run_target, max(args.workers, 1))
+        except Exception as e:
+            logging.error("Error reading targets file %s: %s", targets_file, e)
+            return
+        if not count:
+            logging.error("No targets found in %s. Exiting.", targets_file)
+            return
+
+    if not args.username and not args.targets:
+        logging.error("%sNo targets specified. Exiting.%s", Colors.RED, Colors.RESET)
+        logging.info(
+            "No targets specified. Please provide a valid username or targets file."
+        )
+        logging.info("Print help with -h or --help.")
+
+    end_time = time.time()
+    logging.info("Processing completed in %.2f seconds.", end_time - start_time)
+
+
+# Mode flags checked in order, the first one set selects the handler
+MODE_HANDLERS = (
+    ("monitor", run_monitor_mode),
+    ("only_profile", run_only_profile_mode),
+)
 
 
 def terminal():
@@ -80,23 +242,25 @@ def terminal():
         nargs="?",
         help="GitHub username to analyze",
     )
+    # Modes exclude each other, argparse rejects combinations before any request
+    modes = parser.add_mutually_exclusive_group()
     parser.add_argument(
         "--targets",
         nargs="?",
         const="targets",
         help="File containing a list of GitHub usernames to analyze",
     )
-    parser.add_argument(
+    modes.add_argument(
         "--monitor",
         action="store_true",
         help="Activate monitoring (event watcher) for the target or list of targets",
     )
-    parser.add_argument(
+    modes.add_argument(
         "--only_profile",
         action="store_true",
         help="Only fetch profile data (no commits, followers, etc.)",
     )
-    parser.add_argument(
+    modes.add_argument(
         "--commit_search",
         nargs="?",
         const=True,
@@ -112,7 +276,7 @@ def terminal():
         nargs="?",
         help="Output directory for analysis results",
     )
-    parser.add_argument(
+    modes.add_argument(
         "--parse",
         type=str,
         metavar="USERNAME",
@@ -128,6 +292,24 @@ def terminal():
         action="store_true",
         help="Display summary of key profile information",
     )
+    parser.add_argument(
+        "--workers",
+        "--jobs",
+        dest="workers",
+        type=int,
+        default=1,
+        help="Number of targets from --targets file processed concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--cache_dir",
+        type=str,
+        help="Directory of ETag cached API responses (default: ~/.cache/gh_fake_analyzer/responses)",
+    )
+    parser.add_argument(
+        "--no_cache",
+        action="store_true",
+        help="Do not store or reuse API responses on disk",
+    )
     parser.add_argument(
         "--logoff",
         action="store_true",
@@ -135,8 +317,6 @@ def terminal():
     )
 
     args = parser.parse_args()
-    start_time = time.time()
-    
 
     if args.logoff:
         print("Logging disabled. You will only see error messages.")
@@ -146,78 +326,50 @@ def terminal():
         
         
     if args.parse:
-        if parse_report(args.parse, args.key, args.summary, args.out_path):
-            return
-        else:
-            return
+        parse_report(args.parse, args.key, args.summary, args.out_path)
+        return
+
+    if args.no_cache:
+        APIUtils.set_cache_dir(None)
+    elif args.cache_dir:
+        APIUtils.set_cache_dir(args.cache_dir)
 
     if args.token:
         APIUtils.set_token(args.token)
         logging.info(
-            f"{Colors.GREEN}Using Github Token from command line argument{Colors.RESET}"
+            "%sUsing Github Token from %s%s",
+            Colors.GREEN,
+            "command line argument",
+            Colors.RESET,
         )
     else:
         token = load_github_token()
         if token:
             APIUtils.set_token(token)
             logging.info(
-                f"{Colors.GREEN}Using Github Token from environment{Colors.RESET}"
+                "%sUsing Github Token from %s%s", Colors.GREEN, "environment", Colors.RESET
             )
         else:
             logging.warning(
-                f"{Colors.RED}No GitHub token provided. Rate limits may apply.{Colors.RESET}"
+                "%sNo GitHub token provided. Rate limits may apply.%s",
+                Colors.RED,
+                Colors.RESET,
             )
 
-    if args.monitor:
-        monitor = GitHubMonitor(APIUtils)
+    # Every concurrent target runs its own MAX_WORKERS request threads, the shared
+    # connection pool must fit all. Sized before the warm-up, resizing replaces it
+    if args.targets and args.workers > 1:
+        APIUtils.set_pool_size(args.workers * APIUtils.MAX_WORKERS)
 
-        if args.username:
-            monitor.monitor([args.username])
+    # Connect to the API while the selected mode is still starting up
+    threading.Thread(target=APIUtils.warm_up, daemon=True).start()
 
-        if args.targets:
-            targets = read_targets(args.targets)
-            if not targets:
-                logging.error(f"No targets found in {targets_file}. Exiting.")
-                return
-            monitor.monitor(targets)
-
-    if args.only_profile:
-        logging.info(f"Only fetching profile data for {args.username}...")
-        process_target(args.username, only_profile=True, out_path=args.out_path)
-        return
-
-    if args.username:
-        with open(get_config_path(), 'r') as file:
-            logging.info(f"Config: \n{file.read()}")
-        logging.info(f"Processing single target: {args.username}")
-        
-        process_target(args.username, args.commit_search, out_path=args.out_path)
-
-    if args.targets:
-        targets_file = args.targets
-        
-        with open(get_config_path(), 'r') as file:
-            logging.info(f"Config: \n{file.read()}")
-        logging.info(f"Processing targets from file: {targets_file}")
-
-        targets = read_targets(targets_file)
-        if not targets:
-            logging.error(f"No targets found in {targets_file}. Exiting.")
-            return
-
-        for target in targets:
-            logging.info(f"Processing target: {target}")
-            process_target(target, args.commit_search, out_path=args.out_path)
-
-    if not args.username and not args.targets:
-        logging.error(f"{Colors.RED}No targets specified. Exiting.{Colors.RESET}")
-        logging.info(
-            "No targets specified. Please provide a valid username or targets file."
-        )
-        logging.info("Print help with -h or --help.")
-
-    end_time = time.time()
-    logging.info(f"Processing completed in {end_time - start_time:.2f} seconds.")
+    # Exactly one mode runs, analysis is the default
+    handler = next(
+        (handler for flag, handler in MODE_HANDLERS if getattr(args, flag)),
+        run_analysis_mode,
+    )
+    handler(args)
 
 
 def start_terminal():
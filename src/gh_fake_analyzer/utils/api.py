@@ -1,38 +1,154 @@
 import logging
 import requests
+import threading
 import time
+from collections import deque
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .cache import ResponseCache
 
 
 class APIUtils:
     GITHUB_API_URL = "https://api.github.com"
+    GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
     BASE_GITHUB_URL = "https://github.com/"
     HEADERS = {"Accept": "application/vnd.github.v3+json"}
     RETRY_LIMIT = 10
     ITEMS_PER_PAGE = 100
     SLEEP_INTERVAL = 1
+    MAX_WORKERS = 8
+    SEARCH_RATE_LIMIT = 30  # requests per minute, 10 without a token
+    SEARCH_RATE_LIMIT_UNAUTHENTICATED = 10
+    RATE_LIMIT_RESERVE = 50  # remaining core requests before pollers back off
+    _search_lock = threading.Lock()
+    _search_timestamps = deque()
+    SESSION = None
+    POOL_MAXSIZE = None  # connections kept per host, defaults to MAX_WORKERS
+    _session_lock = threading.Lock()
+    RESPONSE_CACHE = ResponseCache()
+
+    @classmethod
+    def get_session(cls):
+        """
+        Shared keep-alive session, transient 5xx errors are retried by urllib3.
+        The per-host pool holds a connection for every worker thread so
+        concurrent fetches reuse TLS connections instead of discarding them.
+        """
+        with cls._session_lock:
+            if cls.SESSION is None:
+                session = requests.Session()
+                session.mount("https://", cls._build_adapter())
+                cls.SESSION = session
+        return cls.SESSION
+
+    @classmethod
+    def set_pool_size(cls, pool_maxsize):
+        """Resize the per-host connection pool, e.g. for concurrently processed targets."""
+        with cls._session_lock:
+            # A new adapter drops open connections, keep them when nothing changes
+            if pool_maxsize == cls.POOL_MAXSIZE:
+                return
+            cls.POOL_MAXSIZE = pool_maxsize
+            if cls.SESSION is not None:
+                cls.SESSION.mount("https://", cls._build_adapter())
+
+    @classmethod
+    def set_cache_dir(cls, cache_dir):
+        """
+        Keep ETag cached responses in cache_dir instead of the default location,
+        None disables the on-disk response cache.
+        """
+        cls.RESPONSE_CACHE = ResponseCache(cache_dir) if cache_dir else None
+
+    @classmethod
+    def _build_adapter(cls):
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False,
+        )
+        return HTTPAdapter(
+            pool_maxsize=cls.POOL_MAXSIZE or max(cls.MAX_WORKERS, 10),
+            max_retries=retry,
+        )
+
+    @classmethod
+    def github_path(cls, url):
+        """Strip the github.com prefix of a web URL, "/owner/repo/..." is returned."""
+        # Keep the trailing slash, "https://github.com" also prefixes other hosts
+        prefix = cls.BASE_GITHUB_URL
+        return "/" + url[len(prefix):] if url.startswith(prefix) else url
 
     @classmethod
     def set_token(cls, token):
-        if token:
-            cls.HEADERS["Authorization"] = f"token {token}"
+        authorization = f"token {token}"
+        # Shared headers are copied by running requests, only touch them on change
+        if token and cls.HEADERS.get("Authorization") != authorization:
+            cls.HEADERS["Authorization"] = authorization
 
     @classmethod
-    def github_api_request(cls, url, params=None, etag=None):
+    def warm_up(cls):
+        """
+        Open the pooled connection with a /rate_limit call, which costs no quota.
+        Meant for a background thread while the CLI is still setting up, so the
+        first real request reuses an established TLS connection.
+        """
+        try:
+            response = cls.get_session().get(
+                f"{cls.GITHUB_API_URL}/rate_limit", headers=cls.HEADERS.copy()
+            )
+            logging.debug(
+                "Rate limit remaining: %s", response.headers.get("X-RateLimit-Remaining")
+            )
+        except requests.exceptions.RequestException as e:
+            logging.debug("Connection warm-up failed: %s", e)
+
+    @classmethod
+    def github_api_request(cls, url, params=None, etag=None, cache=False):
+        """
+        GET a GitHub API resource.
+
+        With cache=True the last body is kept on disk and the request is sent
+        with its ETag; a 304 answer returns the cached body instead of None.
+        """
         headers = cls.HEADERS.copy()
+        cached = None
+        cache = cache and cls.RESPONSE_CACHE is not None
+        if cache:
+            cache_key = requests.Request("GET", url, params=params).prepare().url
+            cached = cls.RESPONSE_CACHE.get(cache_key)
+            if cached and not etag:
+                etag = cached["etag"]
         if etag:
             headers["If-None-Match"] = etag
 
         retry_count = 0
         while retry_count < cls.RETRY_LIMIT:
             try:
-                response = requests.get(url, headers=cls.HEADERS, params=params)
+                if "/search/" in url:
+                    cls._throttle_search()
+                response = cls.get_session().get(url, headers=headers, params=params)
                 logging.info(f"Request URL: {response.url}")
 
                 # First check response status
                 if response.status_code == 304:
+                    if cached:
+                        logging.info("Not modified, using cached response")
+                        return cached["body"], cls._cached_headers(response, cached)
                     return None, response.headers
                 elif response.status_code == 200:
-                    return response.json(), response.headers
+                    data = response.json()
+                    if cache and response.headers.get("ETag"):
+                        cls.RESPONSE_CACHE.set(
+                            cache_key,
+                            response.headers["ETag"],
+                            data,
+                            response.headers.get("Link"),
+                        )
+                    return data, response.headers
                 elif response.status_code == 401:
                     logging.error("Authentication required. Add GitHub token.")
                     exit(1)
@@ -55,6 +171,91 @@ class APIUtils:
         logging.error(f"Exceeded retry limit ({cls.RETRY_LIMIT}) for URL: {url}")
         return None, None
 
+    @staticmethod
+    def _cached_headers(response, cached):
+        """304 answers may omit pagination, restore Link from the cached entry."""
+        headers = requests.structures.CaseInsensitiveDict(response.headers)
+        if cached.get("link") and "Link" not in headers:
+            headers["Link"] = cached["link"]
+        return headers
+
+    @classmethod
+    def github_graphql_request(cls, query, variables=None):
+        """
+        Execute a GraphQL query against GitHub API v4.
+
+        GraphQL requires authentication, without a token None is returned so
+        callers can fall back to the REST endpoints.
+        """
+        if "Authorization" not in cls.HEADERS:
+            return None
+
+        payload = {"query": query, "variables": variables or {}}
+        retry_count = 0
+        while retry_count < cls.RETRY_LIMIT:
+            try:
+                response = cls.get_session().post(
+                    cls.GITHUB_GRAPHQL_URL, headers=cls.HEADERS, json=payload
+                )
+                logging.info(f"GraphQL request: {response.url}")
+
+                if response.status_code == 200:
+                    result = response.json()
+                    if result.get("errors"):
+                        logging.error(f"GraphQL query failed: {result['errors']}")
+                        return None
+                    return result.get("data")
+                elif response.status_code == 401:
+                    logging.error("Authentication required. Add GitHub token.")
+                    exit(1)
+                elif response.status_code in [403, 429]:
+                    retry_count += 1
+                    if retry_count > 1:
+                        logging.info(f"Retry attempt {retry_count}/{cls.RETRY_LIMIT}")
+
+                    wait_time = cls._handle_rate_limit(response.headers)
+                    time.sleep(wait_time)
+                    continue
+                else:
+                    logging.error(
+                        f"GraphQL request failed with status {response.status_code}"
+                    )
+                    return None
+
+            except requests.exceptions.RequestException as e:
+                logging.error(f"GraphQL request error: {e}")
+                return None
+
+        logging.error(f"Exceeded retry limit ({cls.RETRY_LIMIT}) for GraphQL query")
+        return None
+
+    @classmethod
+    def _throttle_search(cls):
+        """
+        Sliding-window limiter for the search endpoints. Their per-minute limit
+        is not announced in headers, so concurrent searches would otherwise run
+        straight into 403s.
+        """
+        limit = (
+            cls.SEARCH_RATE_LIMIT
+            if "Authorization" in cls.HEADERS
+            else cls.SEARCH_RATE_LIMIT_UNAUTHENTICATED
+        )
+        with cls._search_lock:
+            now = time.monotonic()
+            while cls._search_timestamps and now - cls._search_timestamps[0] >= 60:
+                cls._search_timestamps.popleft()
+
+            if len(cls._search_timestamps) >= limit:
+                wait_time = 60 - (now - cls._search_timestamps[0])
+                logging.info(f"Search rate limit reached. Waiting {wait_time:.1f} seconds")
+                time.sleep(wait_time)
+                now = time.monotonic()
+                while cls._search_timestamps and now - cls._search_timestamps[0] >= 60:
+                    cls._search_timestamps.popleft()
+
+            cls._search_timestamps.append(now)
+
     @classmethod
     def _handle_rate_limit(cls, headers):
         """
@@ -92,26 +293,31 @@ class APIUtils:
         return 30
 
     @classmethod
-    def fetch_all_pages(cls, url, params=None, limit=None):
-        results = []
-        while url and (limit is None or len(results) < limit):
-            response, headers = cls.github_api_request(url, params)
-            if response:
-                new_items = (
-                    response["items"]
-                    if isinstance(response, dict) and "items" in response
-                    else response
-                )
-                results.extend(
-                    new_items[: limit - len(results)]
-                    if limit is not None
-                    else new_items
-                )
-                url = cls._get_next_url(headers)
-                params = None
-            else:
-                break
-        return results[:limit] if limit is not None else results
+    def iter_pages(cls, url, params=None, cache=False):
+        """Yield items page by page, only one page of results is held at a time."""
+        while url:
+            response, headers = cls.github_api_request(url, params, cache=cache)
+            if not response:
+                return
+            yield from (
+                response["items"]
+                if isinstance(response, dict) and "items" in response
+                else response
+            )
+            url = cls._get_next_url(headers)
+            params = None
+
+    @classmethod
+    def fetch_all_pages(cls, url, params=None, limit=None, cache=False):
+        # Small limits fit in one page, don't download items that are cut anyway
+        if limit is not None and params and params.get("per_page", 0) > limit:
+            params = dict(params, per_page=max(limit, 1))
+
+        items = cls.iter_pages(url, params, cache=cache)
+        if limit is not None:
+            # Stops requesting pages once the limit is reached
+            return list(islice(items, limit))
+        return list(items)
 
     @staticmethod
     def _get_next_url(headers):
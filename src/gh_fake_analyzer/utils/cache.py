@@ -0,0 +1,99 @@
+import os
+import json
+import logging
+import hashlib
+import tempfile
+import threading
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "gh_fake_analyzer", "responses"
+)
+# Entries kept on disk, least recently used ones are deleted beyond that
+DEFAULT_MAX_ENTRIES = 10000
+# Writes between checks of the entry count, listing the directory is not free
+PRUNE_INTERVAL = 100
+
+
+class ResponseCache:
+    """
+    On-disk store of GitHub API response bodies keyed by request URL.
+    Each entry keeps the ETag so the next request can be made conditional,
+    a 304 answer is then served from disk and does not count against rate limits.
+    """
+
+    def __init__(self, cache_dir=None, max_entries=DEFAULT_MAX_ENTRIES):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_entries = max_entries
+        self._writes = 0
+        # Entries are written from the fetch thread pools
+        self._writes_lock = threading.Lock()
+
+    def _entry_path(self, key):
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, key):
+        """Return cached entry {"etag", "body", "link"} or None."""
+        path = self._entry_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            # Mark as recently used, prune() evicts the oldest entries first
+            os.utime(path)
+            return entry
+        except (OSError, ValueError) as e:
+            logging.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def set(self, key, etag, body, link=None):
+        """Store response body with its ETag, written atomically."""
+        path = self._entry_path(key)
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"etag": etag, "body": body, "link": link}, f)
+            os.replace(tmp_path, path)
+            tmp_path = None
+        except (OSError, TypeError, ValueError) as e:
+            logging.debug(f"Could not write cache entry {path}: {e}")
+            return
+        finally:
+            # Don't leave a partial temporary file behind in the cache directory
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+        with self._writes_lock:
+            self._writes += 1
+            prune_due = self._writes % PRUNE_INTERVAL == 1
+        if prune_due:
+            self.prune()
+
+    def prune(self):
+        """Delete least recently used entries until at most max_entries are left."""
+        try:
+            with os.scandir(self.cache_dir) as it:
+                entries = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in it
+                    if entry.name.endswith(".json")
+                ]
+        except OSError as e:
+            logging.debug(f"Could not list cache directory {self.cache_dir}: {e}")
+            return
+
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+        entries.sort()
+        for _, path in entries[:excess]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # already removed by a concurrent prune
@@ -1,6 +1,7 @@
 import os
 import configparser
 import logging
+from functools import lru_cache
 from dotenv import load_dotenv
 
 DEFAULT_CONFIG = {
@@ -16,6 +17,7 @@ DEFAULT_CONFIG = {
 }
 
 
+@lru_cache(maxsize=1)
 def load_github_token():
     """
     Load GitHub token with the following precedence:
@@ -38,6 +40,7 @@ def load_github_token():
     return None
 
 
+@lru_cache(maxsize=1)
 def get_config_path():
     """Get the path to the configuration file analyzer is using"""
     user_config = os.path.expanduser("~/.gh_fake_analyzer_config.ini")
@@ -60,6 +63,13 @@ def get_config_path():
     return user_config
 
 
+@lru_cache(maxsize=1)
+def read_config_text():
+    """Contents of the configuration file analyzer is using, read once per run"""
+    with open(get_config_path(), "r") as f:
+        return f.read()
+
+
 def setup_logging(log_name="script.log", logoff=False):
     """
     Set up logging configuration for either the main script or monitoring.
@@ -114,7 +124,7 @@ config_path = get_config_path()
 
 # Load configuration
 config = configparser.ConfigParser()
-config.read(config_path)
+config.read_string(read_config_text(), source=config_path)
 
 # Set limits for the script
 MAX_FOLLOWING = int(config["LIMITS"]["MAX_FOLLOWING"])
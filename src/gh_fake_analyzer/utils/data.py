@@ -2,7 +2,8 @@ import logging
 import os
 import json
 
-POPULAR_COMMIT_MESSAGES = [
+# Matched case-insensitively against stripped commit messages
+POPULAR_COMMIT_MESSAGES = frozenset(message.lower() for message in [
     
     # Build and CI Related
     "ci: update workflow",
@@ -209,10 +210,10 @@ POPULAR_COMMIT_MESSAGES = [
     "Update requirements.txt",
     "initial",
     "final",
-]
+])
 
-# Clutter to remove from profile data
-KEYS_TO_REMOVE = [
+# Clutter to remove from profile data, checked for every key of every nested dict
+KEYS_TO_REMOVE = frozenset({
     "followers_url",
     "following_url",
     "gists_url",
@@ -261,7 +262,7 @@ KEYS_TO_REMOVE = [
     "ssh_url",
     "clone_url",
     "svn_url",
-]
+})
 
 
 class DataManager:
@@ -287,8 +288,10 @@ class DataManager:
 
     def save_to_json(self, data, filename):
         try:
+            # Encode in one call and write once, json.dump() issues a write per token
+            serialized = json.dumps(data, indent=4, ensure_ascii=False)
             with open(filename, "w", encoding="utf-8") as json_file:
-                json.dump(data, json_file, indent=4, ensure_ascii=False)
+                json_file.write(serialized)
             logging.info(f"Successfully saved data to {filename}")
         except Exception as e:
             logging.error(f"Error in save_to_json for {filename}: {e}")
@@ -297,8 +300,8 @@ class DataManager:
     def load_existing(self):
         try:
             if os.path.exists(self.report_file):
-                with open(self.report_file, "r", encoding="utf-8") as json_file:
-                    return json.load(json_file)
+                with open(self.report_file, "rb") as json_file:
+                    return json.loads(json_file.read())
             else:
                 logging.info("No existing data file found")
                 return None
@@ -0,0 +1,88 @@
+import threading
+import time
+import unittest
+
+from gh_fake_analyzer.terminal import run_targets
+
+
+class RunTargetsTest(unittest.TestCase):
+    TIMEOUT = 10
+
+    def run_in_thread(self, targets, handle, workers):
+        """Run run_targets in a thread, failing the test instead of hanging."""
+        outcome = {}
+
+        def run():
+            try:
+                outcome["count"] = run_targets(iter(targets), handle, workers)
+            except BaseException as e:
+                outcome["error"] = e
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(self.TIMEOUT)
+        self.assertFalse(thread.is_alive(), "run_targets did not return")
+        return outcome
+
+    def test_handles_every_target(self):
+        handled = []
+        targets = [f"user{i}" for i in range(20)]
+        outcome = self.run_in_thread(targets, handled.append, workers=3)
+        self.assertEqual(outcome, {"count": 20})
+        self.assertCountEqual(handled, targets)
+
+    def test_handler_error_does_not_stop_run(self):
+        handled = []
+
+        def handle(target):
+            if target == "user1":
+                raise ValueError("broken target")
+            handled.append(target)
+
+        outcome = self.run_in_thread(["user0", "user1", "user2"], handle, workers=1)
+        self.assertEqual(outcome, {"count": 3})
+        self.assertEqual(handled, ["user0", "user2"])
+
+    def test_exit_on_last_queued_target_stops_run(self):
+        # exit(1) is how github_api_request ends the run on a bad token
+        for workers, total in ((1, 5), (2, 10)):
+            with self.subTest(workers=workers, total=total):
+                targets = [f"user{i}" for i in range(total)]
+
+                def handle(target):
+                    time.sleep(0.05)
+                    if target == targets[-1]:
+                        exit(1)
+
+                outcome = self.run_in_thread(targets, handle, workers)
+                self.assertIsInstance(outcome.get("error"), SystemExit)
+
+    def test_exit_while_queue_is_full_stops_run(self):
+        # Running and queued targets fill the queue, the reader is left waiting to
+        # queue stop markers when the running targets exit
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+
+                def handle(target):
+                    time.sleep(0.2)
+                    exit(1)
+
+                targets = [f"user{i}" for i in range(workers * 5)]
+                outcome = self.run_in_thread(targets, handle, workers)
+                self.assertIsInstance(outcome.get("error"), SystemExit)
+
+    def test_exit_stops_queued_targets(self):
+        handled = []
+
+        def handle(target):
+            handled.append(target)
+            time.sleep(0.05)
+            exit(1)
+
+        outcome = self.run_in_thread([f"user{i}" for i in range(10)], handle, workers=1)
+        self.assertIsInstance(outcome.get("error"), SystemExit)
+        self.assertEqual(handled, ["user0"])
+
+
+if __name__ == "__main__":
+    unittest.main()